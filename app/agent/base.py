@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
+from itertools import islice
 from typing import List, Optional
 
 from pydantic import BaseModel, Field, model_validator
@@ -10,6 +11,15 @@ from app.sandbox.client import SANDBOX_CLIENT
 from app.schema import ROLE_TYPE, AgentState, Memory, Message
 
 
+# Message factory per role, built once instead of on every update_memory call
+MESSAGE_FACTORIES = {
+    "user": Message.user_message,
+    "system": Message.system_message,
+    "assistant": Message.assistant_message,
+    "tool": Message.tool_message,
+}
+
+
 class BaseAgent(BaseModel, ABC):
     """Abstract base class for managing agent state and execution.
 
@@ -99,19 +109,13 @@ class BaseAgent(BaseModel, ABC):
         Raises:
             ValueError: If the role is unsupported.
         """
-        message_map = {
-            "user": Message.user_message,
-            "system": Message.system_message,
-            "assistant": Message.assistant_message,
-            "tool": lambda content, **kw: Message.tool_message(content, **kw),
-        }
-
-        if role not in message_map:
+        factory = MESSAGE_FACTORIES.get(role)
+        if factory is None:
             raise ValueError(f"Unsupported message role: {role}")
 
         # Create message with appropriate parameters based on role
         kwargs = {"base64_image": base64_image, **(kwargs if role == "tool" else {})}
-        self.memory.add_message(message_map[role](content, **kwargs))
+        self.memory.add_message(factory(content, **kwargs))
 
     async def run(self, request: Optional[str] = None) -> str:
         """Execute the agent's main loop asynchronously.
@@ -176,12 +180,13 @@ class BaseAgent(BaseModel, ABC):
         if not last_message.content:
             return False
 
-        # Count identical content occurrences
-        duplicate_count = sum(
-            1
-            for msg in reversed(self.memory.messages[:-1])
-            if msg.role == "assistant" and msg.content == last_message.content
-        )
+        # Count identical content occurrences, stopping once the threshold is hit
+        duplicate_count = 0
+        for msg in islice(reversed(self.memory.messages), 1, None):
+            if msg.role == "assistant" and msg.content == last_message.content:
+                duplicate_count += 1
+                if duplicate_count >= self.duplicate_threshold:
+                    return True
 
         return duplicate_count >= self.duplicate_threshold
 
@@ -2,7 +2,7 @@ from typing import Dict, List, Optional
 
 from pydantic import Field, model_validator
 
-from app.agent.browser import BrowserContextHelper
+from app.agent.browser import BROWSER_TOOL_NAME, BrowserContextHelper
 from app.agent.toolcall import ToolCallAgent
 from app.config import config
 from app.logger import logger
@@ -146,7 +146,7 @@ class Manus(ToolCallAgent):
         original_prompt = self.next_step_prompt
         recent_messages = self.memory.messages[-3:] if self.memory.messages else []
         browser_in_use = any(
-            tc.function.name == BrowserUseTool().name
+            tc.function.name == BROWSER_TOOL_NAME
             for msg in recent_messages
             if msg.tool_calls
             for tc in msg.tool_calls
@@ -224,24 +224,32 @@ class ToolCallAgent(ReActAgent):
 
     def _is_special_tool(self, name: str) -> bool:
         """Check if tool name is in special tools list"""
-        return name.lower() in [n.lower() for n in self.special_tool_names]
+        name = name.lower()
+        return any(name == n.lower() for n in self.special_tool_names)
 
     async def cleanup(self):
         """Clean up resources used by the agent's tools."""
         logger.info(f"🧹 Cleaning up resources for agent '{self.name}'...")
-        for tool_name, tool_instance in self.available_tools.tool_map.items():
-            if hasattr(tool_instance, "cleanup") and asyncio.iscoroutinefunction(
-                tool_instance.cleanup
-            ):
-                try:
-                    logger.debug(f"🧼 Cleaning up tool: {tool_name}")
-                    await tool_instance.cleanup()
-                except Exception as e:
-                    logger.error(
-                        f"🚨 Error cleaning up tool '{tool_name}': {e}", exc_info=True
-                    )
+        # Tool cleanups are independent, so release them concurrently
+        await asyncio.gather(
+            *(
+                self._cleanup_tool(tool_name, tool_instance)
+                for tool_name, tool_instance in self.available_tools.tool_map.items()
+                if hasattr(tool_instance, "cleanup")
+                and asyncio.iscoroutinefunction(tool_instance.cleanup)
+            )
+        )
         logger.info(f"✨ Cleanup complete for agent '{self.name}'.")
 
+    @staticmethod
+    async def _cleanup_tool(tool_name: str, tool_instance: Any) -> None:
+        """Clean up a single tool, logging instead of raising on failure."""
+        try:
+            logger.debug(f"🧼 Cleaning up tool: {tool_name}")
+            await tool_instance.cleanup()
+        except Exception as e:
+            logger.error(f"🚨 Error cleaning up tool '{tool_name}': {e}", exc_info=True)
+
     async def run(self, request: Optional[str] = None) -> str:
         """Run the agent with cleanup when done."""
         try:
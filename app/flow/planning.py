@@ -1,4 +1,5 @@
 import json
+import re
 import time
 from enum import Enum
 from typing import Dict, List, Optional, Union
@@ -9,10 +10,20 @@ from app.agent.base import BaseAgent
 from app.flow.base import BaseFlow
 from app.llm import LLM
 from app.logger import logger
+from app.prompt.planning import (
+    PLAN_CREATION_SYSTEM_PROMPT,
+    PLAN_CREATION_USER_PROMPT,
+    PLAN_SUMMARY_SYSTEM_PROMPT,
+    PLAN_SUMMARY_USER_PROMPT,
+)
 from app.schema import AgentState, Message, ToolChoice
 from app.tool import PlanningTool
 
 
+# Matches an agent/type tag in a step, e.g. "[SEARCH] Find sources"
+STEP_TYPE_PATTERN = re.compile(r"\[([A-Z_]+)\]")
+
+
 class PlanStepStatus(str, Enum):
     """Enum class defining possible statuses of a plan step"""
 
@@ -137,11 +148,7 @@ class PlanningFlow(BaseFlow):
         """Create an initial plan based on the request using the flow's LLM and PlanningTool."""
         logger.info(f"Creating initial plan with ID: {self.active_plan_id}")
 
-        system_message_content = (
-            "You are a planning assistant. Create a concise, actionable plan with clear steps. "
-            "Focus on key milestones rather than detailed sub-steps. "
-            "Optimize for clarity and efficiency."
-        )
+        system_message_content = PLAN_CREATION_SYSTEM_PROMPT
         agents_description = []
         for key in self.executor_keys:
             if key in self.agents:
@@ -164,7 +171,7 @@ class PlanningFlow(BaseFlow):
 
         # Create a user message with the request
         user_message = Message.user_message(
-            f"Create a reasonable plan with clear steps to accomplish the task: {request}"
+            PLAN_CREATION_USER_PROMPT.format(request=request)
         )
 
         # Call LLM with PlanningTool
@@ -229,20 +236,19 @@ class PlanningFlow(BaseFlow):
             step_statuses = plan_data.get("step_statuses", [])
 
             # Find first non-completed step
+            active_statuses = frozenset(PlanStepStatus.get_active_statuses())
             for i, step in enumerate(steps):
                 if i >= len(step_statuses):
                     status = PlanStepStatus.NOT_STARTED.value
                 else:
                     status = step_statuses[i]
 
-                if status in PlanStepStatus.get_active_statuses():
+                if status in active_statuses:
                     # Extract step type/category if available
                     step_info = {"text": step}
 
                     # Try to extract step type from the text (e.g., [SEARCH] or [CODE])
-                    import re
-
-                    type_match = re.search(r"\[([A-Z_]+)\]", step)
+                    type_match = STEP_TYPE_PATTERN.search(step)
                     if type_match:
                         step_info["type"] = type_match.group(1).lower()
 
@@ -409,12 +415,10 @@ class PlanningFlow(BaseFlow):
 
         # Create a summary using the flow's LLM directly
         try:
-            system_message = Message.system_message(
-                "You are a planning assistant. Your task is to summarize the completed plan."
-            )
+            system_message = Message.system_message(PLAN_SUMMARY_SYSTEM_PROMPT)
 
             user_message = Message.user_message(
-                f"The plan has been completed. Here is the final plan status:\n\n{plan_text}\n\nPlease provide a summary of what was accomplished and any final thoughts."
+                PLAN_SUMMARY_USER_PROMPT.format(plan_text=plan_text)
             )
 
             response = await self.llm.ask(
@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
 import tiktoken
@@ -18,7 +19,6 @@ from tenacity import (
     wait_random_exponential,
 )
 
-from app.bedrock import BedrockClient
 from app.config import LLMSettings, config
 from app.exceptions import TokenLimitExceeded
 from app.logger import logger  # Assuming a logger is set up in your app
@@ -54,12 +54,26 @@ class TokenCounter:
     HIGH_DETAIL_TARGET_SHORT_SIDE = 768
     TILE_SIZE = 512
 
+    # Text token count memo: number of entries, and longest text memoized
+    TEXT_CACHE_SIZE = 2048
+    MAX_CACHED_TEXT_LENGTH = 8192
+
+    __slots__ = ("tokenizer", "_count_encoded")
+
     def __init__(self, tokenizer):
         self.tokenizer = tokenizer
+        # Memoize short texts only; the counter lives as long as the LLM singleton
+        self._count_encoded = lru_cache(maxsize=self.TEXT_CACHE_SIZE)(
+            lambda text: len(tokenizer.encode(text))
+        )
 
     def count_text(self, text: str) -> int:
         """Calculate tokens for a text string"""
-        return 0 if not text else len(self.tokenizer.encode(text))
+        if not text:
+            return 0
+        if len(text) > self.MAX_CACHED_TEXT_LENGTH:
+            return len(self.tokenizer.encode(text))
+        return self._count_encoded(text)
 
     def count_image(self, image_item: dict) -> int:
         """
@@ -220,6 +234,9 @@ class LLM:
                     api_version=self.api_version,
                 )
             elif self.api_type == "aws":
+                # Imported here so boto3 is only loaded when Bedrock is configured
+                from app.bedrock import BedrockClient
+
                 self.client = BedrockClient()
             else:
                 self.client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
@@ -228,9 +245,7 @@ class LLM:
 
     def count_tokens(self, text: str) -> int:
         """Calculate the number of tokens in a text"""
-        if not text:
-            return 0
-        return len(self.tokenizer.encode(text))
+        return self.token_counter.count_text(text)
 
     def count_message_tokens(self, messages: List[dict]) -> int:
         return self.token_counter.count_message_tokens(messages)
@@ -438,15 +453,14 @@ class LLM:
             response = await self.client.chat.completions.create(**params, stream=True)
 
             collected_messages = []
-            completion_text = ""
             async for chunk in response:
                 chunk_message = chunk.choices[0].delta.content or ""
                 collected_messages.append(chunk_message)
-                completion_text += chunk_message
                 print(chunk_message, end="", flush=True)
 
             print()  # Newline after streaming
-            full_response = "".join(collected_messages).strip()
+            completion_text = "".join(collected_messages)
+            full_response = completion_text.strip()
             if not full_response:
                 raise ValueError("Empty response from streaming LLM")
 
@@ -687,22 +701,25 @@ class LLM:
             else:
                 messages = self.format_messages(messages, supports_images)
 
-            # Calculate input token count
-            input_tokens = self.count_message_tokens(messages)
-
-            # If there are tools, calculate token count for tool descriptions
-            tools_tokens = 0
-            if tools:
-                for tool in tools:
-                    tools_tokens += self.count_tokens(str(tool))
-
-            input_tokens += tools_tokens
-
-            # Check if token limits are exceeded
-            if not self.check_token_limit(input_tokens):
-                error_message = self.get_limit_error_message(input_tokens)
-                # Raise a special exception that won't be retried
-                raise TokenLimitExceeded(error_message)
+            # The input token count is only used for the limit check here (usage
+            # comes from the response), so skip tokenizing when there is no limit
+            if self.max_input_tokens is not None:
+                # Calculate input token count
+                input_tokens = self.count_message_tokens(messages)
+
+                # If there are tools, calculate token count for tool descriptions
+                tools_tokens = 0
+                if tools:
+                    for tool in tools:
+                        tools_tokens += self.count_tokens(str(tool))
+
+                input_tokens += tools_tokens
+
+                # Check if token limits are exceeded
+                if not self.check_token_limit(input_tokens):
+                    error_message = self.get_limit_error_message(input_tokens)
+                    # Raise a special exception that won't be retried
+                    raise TokenLimitExceeded(error_message)
 
             # Validate tools if provided
             if tools:
@@ -25,3 +25,23 @@ Choose the most efficient path forward:
 
 Be concise in your reasoning, then select the appropriate tool or action.
 """
+
+PLAN_CREATION_SYSTEM_PROMPT = (
+    "You are a planning assistant. Create a concise, actionable plan with clear steps. "
+    "Focus on key milestones rather than detailed sub-steps. "
+    "Optimize for clarity and efficiency."
+)
+
+PLAN_CREATION_USER_PROMPT = (
+    "Create a reasonable plan with clear steps to accomplish the task: {request}"
+)
+
+PLAN_SUMMARY_SYSTEM_PROMPT = (
+    "You are a planning assistant. Your task is to summarize the completed plan."
+)
+
+PLAN_SUMMARY_USER_PROMPT = (
+    "The plan has been completed. Here is the final plan status:\n\n"
+    "{plan_text}\n\n"
+    "Please provide a summary of what was accomplished and any final thoughts."
+)
@@ -197,11 +197,14 @@ class SandboxManager:
                 ):
                     to_cleanup.append(sandbox_id)
 
-        for sandbox_id in to_cleanup:
-            try:
-                await self.delete_sandbox(sandbox_id)
-            except Exception as e:
-                logger.error(f"Error cleaning up sandbox {sandbox_id}: {e}")
+        # Sandbox removals are independent, so tear them down concurrently
+        results = await asyncio.gather(
+            *(self.delete_sandbox(sandbox_id) for sandbox_id in to_cleanup),
+            return_exceptions=True,
+        )
+        for sandbox_id, result in zip(to_cleanup, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error cleaning up sandbox {sandbox_id}: {result}")
 
     async def cleanup(self) -> None:
         """Cleans up all resources."""
@@ -16,6 +16,10 @@ from docker.errors import APIError
 from docker.models.containers import Container
 
 
+# Trailing "$ echo $?" exit-status probe echoed back by the shell
+ECHO_STATUS_PATTERN = re.compile(r"\n\$ echo \$\$?.*$")
+
+
 class DockerSession:
     def __init__(self, container_id: str) -> None:
         """Initializes a Docker session.
@@ -183,10 +187,11 @@ class DockerSession:
                                 command_sent = True
                                 continue
 
-                            if line.strip() == b"echo $?" or line.strip().isdigit():
+                            stripped = line.strip()
+                            if stripped == b"echo $?" or stripped.isdigit():
                                 continue
 
-                            if line.strip():
+                            if stripped:
                                 result_lines.append(line)
 
                         if buffer.endswith(b"$ "):
@@ -199,7 +204,7 @@ class DockerSession:
                         raise
 
                 output = b"\n".join(result_lines).decode("utf-8")
-                output = re.sub(r"\n\$ echo \$\$?.*$", "", output)
+                output = ECHO_STATUS_PATTERN.sub("", output)
 
                 return output
 
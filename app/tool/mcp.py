@@ -1,3 +1,5 @@
+import asyncio
+import re
 from contextlib import AsyncExitStack
 from typing import Dict, List, Optional
 
@@ -11,6 +13,9 @@ from app.tool.base import BaseTool, ToolResult
 from app.tool.tool_collection import ToolCollection
 
 
+INVALID_TOOL_NAME_CHARS = re.compile(r"[^a-zA-Z0-9-]+")
+
+
 class MCPClientTool(BaseTool):
     """Represents a tool proxy that can be called on the MCP server from the client side."""
 
@@ -127,13 +132,8 @@ class MCPClients(ToolCollection):
 
     def _sanitize_tool_name(self, name: str) -> str:
         """Sanitize tool name to match MCPClientTool requirements."""
-        import re
-
-        # Replace invalid characters with underscores
-        sanitized = re.sub(r"[^a-zA-Z0-9_-]", "_", name)
-
-        # Remove consecutive underscores
-        sanitized = re.sub(r"_+", "_", sanitized)
+        # Replace runs of invalid characters and underscores with one underscore
+        sanitized = INVALID_TOOL_NAME_CHARS.sub("_", name)
 
         # Remove leading/trailing underscores
         sanitized = sanitized.strip("_")
@@ -147,8 +147,11 @@ class MCPClients(ToolCollection):
     async def list_tools(self) -> ListToolsResult:
         """List all available tools."""
         tools_result = ListToolsResult(tools=[])
-        for session in self.sessions.values():
-            response = await session.list_tools()
+        # Query all servers concurrently; results keep session order
+        responses = await asyncio.gather(
+            *(session.list_tools() for session in self.sessions.values())
+        )
+        for response in responses:
             tools_result.tools += response.tools
         return tools_result
 
@@ -1,4 +1,6 @@
 import asyncio
+import threading
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -19,6 +21,13 @@ from app.tool.search import (
 from app.tool.search.base import SearchItem
 
 
+# Maximum number of characters of page text kept per fetched result
+MAX_CONTENT_LENGTH = 10000
+
+# Maximum number of bytes of a result page downloaded before parsing
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+
 class SearchResult(BaseModel):
     """Represents a single search result returned by a search engine."""
 
@@ -106,8 +115,30 @@ class SearchResponse(ToolResult):
 class WebContentFetcher:
     """Utility class for fetching web content."""
 
-    @staticmethod
-    async def fetch_content(url: str, timeout: int = 10) -> Optional[str]:
+    _headers = {
+        "WebSearch": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    }
+    # Sessions are never closed: each executor thread keeps its pool for life
+    _local = threading.local()
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the calling thread's session, creating it on first use.
+
+        Fetches run in executor threads and requests.Session is not guaranteed
+        to be thread-safe, so each thread keeps its own pooled session.
+        """
+        session = getattr(cls._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(cls._headers)
+            # Don't carry cookies from one fetched site over to later fetches
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            cls._local.session = session
+        return session
+
+    @classmethod
+    async def fetch_content(cls, url: str, timeout: int = 10) -> Optional[str]:
         """
         Fetch and extract the main content from a webpage.
 
@@ -118,40 +149,66 @@ class WebContentFetcher:
         Returns:
             Extracted text content or None if fetching fails
         """
-        headers = {
-            "WebSearch": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-
         try:
             # Use asyncio to run requests in a thread pool
-            response = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: requests.get(url, headers=headers, timeout=timeout)
+            html = await asyncio.get_event_loop().run_in_executor(
+                None, lambda: cls._download_html(url, timeout)
             )
-
-            if response.status_code != 200:
-                logger.warning(
-                    f"Failed to fetch content from {url}: HTTP {response.status_code}"
-                )
+            if html is None:
                 return None
 
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(response.text, "html.parser")
+            # Parse HTML with BeautifulSoup, using the C-backed lxml parser as the
+            # Bing engine does
+            soup = BeautifulSoup(html, "lxml")
 
             # Remove script and style elements
             for script in soup(["script", "style", "header", "footer", "nav"]):
-                script.extract()
-
-            # Get text content
-            text = soup.get_text(separator="\n", strip=True)
-
-            # Clean up whitespace and limit size (100KB max)
-            text = " ".join(text.split())
-            return text[:10000] if text else None
+                script.decompose()
+
+            # Collapse whitespace in a single pass over the text nodes, stopping
+            # once enough text has been collected for the size limit
+            parts = []
+            length = 0
+            for string in soup.stripped_strings:
+                part = " ".join(string.split())
+                parts.append(part)
+                length += len(part) + 1
+                if length > MAX_CONTENT_LENGTH:
+                    break
+
+            text = " ".join(parts)
+            return text[:MAX_CONTENT_LENGTH] if text else None
 
         except Exception as e:
             logger.warning(f"Error fetching content from {url}: {e}")
             return None
 
+    @classmethod
+    def _download_html(cls, url: str, timeout: int) -> Optional[str]:
+        """Download an HTML page, reading at most MAX_PAGE_BYTES of its body."""
+        with cls._get_session().get(url, timeout=timeout, stream=True) as response:
+            if response.status_code != 200:
+                logger.warning(
+                    f"Failed to fetch content from {url}: HTTP {response.status_code}"
+                )
+                return None
+
+            # Skip downloads (PDFs, images, archives) that would be thrown away
+            content_type = response.headers.get("Content-Type", "")
+            if content_type and "html" not in content_type.lower():
+                logger.warning(f"Skipping non-HTML content from {url}: {content_type}")
+                return None
+
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body.extend(chunk)
+                if len(body) >= MAX_PAGE_BYTES:
+                    break
+
+            return body[:MAX_PAGE_BYTES].decode(
+                response.encoding or "utf-8", errors="replace"
+            )
+
 
 class WebSearch(BaseTool):
     """Search the web for information using various search engines."""
@@ -220,31 +277,16 @@ class WebSearch(BaseTool):
             A structured response containing search results and metadata
         """
         # Get settings from config
-        retry_delay = (
-            getattr(config.search_config, "retry_delay", 60)
-            if config.search_config
-            else 60
-        )
-        max_retries = (
-            getattr(config.search_config, "max_retries", 3)
-            if config.search_config
-            else 3
-        )
+        search_config = config.search_config
+        retry_delay = getattr(search_config, "retry_delay", 60) if search_config else 60
+        max_retries = getattr(search_config, "max_retries", 3) if search_config else 3
 
         # Use config values for lang and country if not specified
         if lang is None:
-            lang = (
-                getattr(config.search_config, "lang", "en")
-                if config.search_config
-                else "en"
-            )
+            lang = getattr(search_config, "lang", "en") if search_config else "en"
 
         if country is None:
-            country = (
-                getattr(config.search_config, "country", "us")
-                if config.search_config
-                else "us"
-            )
+            country = getattr(search_config, "country", "us") if search_config else "us"
 
         search_params = {"lang": lang, "country": country}
 
@@ -309,18 +351,34 @@ class WebSearch(BaseTool):
                     f"Search successful with {engine_name.capitalize()} after trying: {', '.join(failed_engines)}"
                 )
 
-            # Transform search items into structured results
-            return [
-                SearchResult(
-                    position=i + 1,
-                    url=item.url,
-                    title=item.title
-                    or f"Result {i+1}",  # Ensure we always have a title
-                    description=item.description or "",
-                    source=engine_name,
+            # Transform search items into structured results, dropping repeated
+            # URLs so their content is not fetched and shown twice
+            results = []
+            seen_urls = set()
+            for item in search_items:
+                if item.url:
+                    if item.url in seen_urls:
+                        continue
+                    seen_urls.add(item.url)
+                position = len(results) + 1
+                results.append(
+                    SearchResult(
+                        position=position,
+                        url=item.url,
+                        title=item.title
+                        or f"Result {position}",  # Ensure we always have a title
+                        description=item.description or "",
+                        source=engine_name,
+                    )
                 )
-                for i, item in enumerate(search_items)
-            ]
+
+            duplicates = len(search_items) - len(results)
+            if duplicates:
+                logger.info(
+                    f"Dropped {duplicates} duplicate result(s) from {engine_name.capitalize()}, "
+                    f"returning {len(results)} of {num_results} requested"
+                )
+            return results
 
         if failed_engines:
             logger.error(f"All search engines failed: {', '.join(failed_engines)}")
@@ -359,15 +417,15 @@ class WebSearch(BaseTool):
 
     def _get_engine_order(self) -> List[str]:
         """Determines the order in which to try search engines."""
+        search_config = config.search_config
         preferred = (
-            getattr(config.search_config, "engine", "google").lower()
-            if config.search_config
+            getattr(search_config, "engine", "google").lower()
+            if search_config
             else "google"
         )
         fallbacks = (
-            [engine.lower() for engine in config.search_config.fallback_engines]
-            if config.search_config
-            and hasattr(config.search_config, "fallback_engines")
+            [engine.lower() for engine in search_config.fallback_engines]
+            if search_config and hasattr(search_config, "fallback_engines")
             else []
         )
 
@@ -0,0 +1,117 @@
+import pytest
+
+from app.tool.search.base import SearchItem
+from app.tool.web_search import MAX_PAGE_BYTES, WebContentFetcher, WebSearch
+
+
+@pytest.fixture
+def web_search(monkeypatch) -> WebSearch:
+    """Creates a web search tool that only tries the Google engine."""
+    monkeypatch.setattr(WebSearch, "_get_engine_order", lambda self: ["google"])
+    return WebSearch()
+
+
+@pytest.mark.asyncio
+async def test_try_all_engines_drops_duplicate_urls(web_search, monkeypatch):
+    """Tests that repeated URLs are dropped and positions are renumbered."""
+    items = [
+        SearchItem(title="First", url="https://example.com/a"),
+        SearchItem(title="Again", url="https://example.com/a"),
+        SearchItem(title="", url="https://example.com/b"),
+        SearchItem(title="No URL", url=""),
+        SearchItem(title="Also no URL", url=""),
+    ]
+
+    async def fake_search(self, engine, query, num_results, search_params):
+        return items
+
+    monkeypatch.setattr(WebSearch, "_perform_search_with_engine", fake_search)
+
+    results = await web_search._try_all_engines("query", 5, {})
+
+    assert [r.url for r in results] == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "",
+        "",
+    ]
+    assert [r.position for r in results] == [1, 2, 3, 4]
+    assert results[0].title == "First"
+    assert results[1].title == "Result 2"
+    assert all(r.source == "google" for r in results)
+
+
+class FakeResponse:
+    """Minimal streamed requests response."""
+
+    def __init__(self, body: bytes, content_type=None, status_code: int = 200):
+        self.status_code = status_code
+        self.headers = {"Content-Type": content_type} if content_type else {}
+        self.encoding = "utf-8"
+        self._body = body
+        self.bytes_read = 0
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self._body), chunk_size):
+            chunk = self._body[start : start + chunk_size]
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def stub_session(monkeypatch, response: FakeResponse) -> None:
+    """Routes WebContentFetcher downloads to the given response."""
+
+    class FakeSession:
+        def get(self, url, timeout=None, stream=False):
+            assert stream
+            return response
+
+    monkeypatch.setattr(WebContentFetcher, "_get_session", lambda: FakeSession())
+
+
+@pytest.mark.asyncio
+async def test_fetch_content_skips_non_html(monkeypatch):
+    """Tests that responses declaring a non-HTML type are not parsed."""
+    response = FakeResponse(b"%PDF-1.7 ...", content_type="application/pdf")
+    stub_session(monkeypatch, response)
+
+    assert await WebContentFetcher.fetch_content("https://example.com/a.pdf") is None
+    assert response.bytes_read == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_content_accepts_html_case_insensitively(monkeypatch):
+    """Tests that the media type check ignores case."""
+    html = b"<html><body><p>Hello   world</p></body></html>"
+    stub_session(monkeypatch, FakeResponse(html, content_type="Text/HTML"))
+
+    content = await WebContentFetcher.fetch_content("https://example.com")
+    assert content == "Hello world"
+
+
+@pytest.mark.asyncio
+async def test_fetch_content_parses_missing_content_type(monkeypatch):
+    """Tests that responses without a Content-Type header are still parsed."""
+    html = b"<html><body><nav>Menu</nav><p>Main text</p></body></html>"
+    stub_session(monkeypatch, FakeResponse(html))
+
+    content = await WebContentFetcher.fetch_content("https://example.com")
+    assert content == "Main text"
+
+
+def test_download_html_truncates_at_max_page_bytes(monkeypatch):
+    """Tests that the body is cut at MAX_PAGE_BYTES and the stream abandoned."""
+    body = b"a" * (MAX_PAGE_BYTES * 2)
+    response = FakeResponse(body, content_type="text/html; charset=utf-8")
+    stub_session(monkeypatch, response)
+
+    html = WebContentFetcher._download_html("https://example.com", timeout=10)
+
+    assert len(html) == MAX_PAGE_BYTES
+    assert response.bytes_read < len(body)